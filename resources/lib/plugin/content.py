@@ -67,7 +67,6 @@ class PluginContent(object):
                                    'operator': 'isnot', 'value': self.exclude_value}
 
     def helper(self):
-        log(f'FUCK75_', force=True)
         resume = {'position': 0, 'total': 100}
         progress_types = [
             'ListItem.PercentPlayed',
@@ -76,16 +75,15 @@ class PluginContent(object):
         for type in progress_types:
             position = infolabel(type)
             if position:
-                log(f'FUCK99_{position}', force=True)
                 resume['position'] = int(position)
                 break
         else:
             if 'set' in self.dbtype:
-                log(f'FUCK76_', force=True)
                 watched = 0
                 query = json_call(
                     'VideoLibrary.GetMovieSetDetails',
-                    params={'setid': int(self.dbid)},
+                    params={'setid': int(self.dbid),
+                            'movies': {'properties': ['playcount']}},
                     parent='get_set_movies'
                 )
                 try:
@@ -95,18 +93,10 @@ class PluginContent(object):
                     total = 0
                 else:
                     for movie in movies:
-                        query = json_call(
-                            'VideoLibrary.GetMovieDetails',
-                            params={'properties': [
-                                'playcount'], 'movieid': movie['movieid']},
-                            parent='get_movie_playcounts'
-                        )
-                        playcount = query['result']['moviedetails'].get('playcount')
-                        if playcount:
+                        if movie.get('playcount'):
                             watched += 1
                 finally:
                     # https://stackoverflow.com/a/68118106/21112145 to avoid ZeroDivisionError
-                    log(f'FUCK77_ {watched} / {total}', force=True)
                     resume['position'] = (total and watched / total or 0) * 100
         data = [{'title': infolabel('ListItem.Label'), 'resume': resume}]
         add_items(self.li, data)
@@ -140,21 +130,26 @@ class PluginContent(object):
             except Exception:
                 log('Widget in_progress: No episodes found.')
             else:
+                # Episodes of the same show share one details lookup
+                tvshows = {}
                 for episode in json_query:
                     tvshowid = episode.get('tvshowid')
-                    tvshow_json_query = json_call(
-                        'VideoLibrary.GetTVShowDetails',
-                        params={'tvshowid': tvshowid},
-                        properties=['studio', 'mpaa'],
-                        parent='in_progress'
-                    )
-                    try:
-                        tvshow_json_query = tvshow_json_query['result']['tvshowdetails']
-                    except Exception:
-                        log(f'Widget in_progress: Parent tv show not found --> {tvshowid}')
-                    else:
-                        episode['studio'] = tvshow_json_query.get('studio')
-                        episode['mpaa'] = tvshow_json_query.get('mpaa')
+                    if tvshowid not in tvshows:
+                        tvshow_json_query = json_call(
+                            'VideoLibrary.GetTVShowDetails',
+                            params={'tvshowid': tvshowid},
+                            properties=['studio', 'mpaa'],
+                            parent='in_progress'
+                        )
+                        try:
+                            tvshows[tvshowid] = tvshow_json_query['result']['tvshowdetails']
+                        except Exception:
+                            log(f'Widget in_progress: Parent tv show not found --> {tvshowid}')
+                            tvshows[tvshowid] = None
+                    tvshow_details = tvshows[tvshowid]
+                    if tvshow_details:
+                        episode['studio'] = tvshow_details.get('studio')
+                        episode['mpaa'] = tvshow_details.get('mpaa')
                 add_items(self.li, json_query, type='episode')
         set_plugincontent(content='movies',
                           category=ADDON.getLocalizedString(32601))
@@ -178,6 +173,7 @@ class PluginContent(object):
 
         for episode in json_query:
             use_last_played_season = True
+            tvshowid = int(episode['tvshowid'])
             studio = episode.get('studio', '')
             mpaa = episode.get('mpaa', '')
             last_played_query = json_call('VideoLibrary.GetEpisodes',
@@ -185,8 +181,7 @@ class PluginContent(object):
                                           sort={'order': 'descending', 'method': 'lastplayed'}, limit=1,
                                           query_filter={'and': [
                                               {'or': [self.filter_inprogress, self.filter_watched]}, self.filter_no_specials]},
-                                          params={'tvshowid': int(
-                                              episode['tvshowid'])},
+                                          params={'tvshowid': tvshowid},
                                           parent='next_up'
                                           )
 
@@ -200,8 +195,7 @@ class PluginContent(object):
                                           sort={'order': 'ascending', 'method': 'episode'}, limit=1,
                                           query_filter={'and': [self.filter_unwatched, {'field': 'season', 'operator': 'is', 'value': str(
                                               last_played_query['result']['episodes'][0].get('season'))}]},
-                                          params={'tvshowid': int(
-                                              episode['tvshowid'])},
+                                          params={'tvshowid': tvshowid},
                                           parent='next_up'
                                           )
 
@@ -215,8 +209,7 @@ class PluginContent(object):
                                           sort={'order': 'ascending', 'method': 'episode'}, limit=1,
                                           query_filter={
                                               'and': [self.filter_unwatched, self.filter_no_specials]},
-                                          params={'tvshowid': int(
-                                              episode['tvshowid'])},
+                                          params={'tvshowid': tvshowid},
                                           parent='next_up'
                                           )
 
@@ -300,10 +293,10 @@ class PluginContent(object):
         except Exception:
             log(f'Widget actor_credits: No movies found for {self.label}.')
         else:
-            dict_to_remove = next(
-                (item for item in movies_json_query if item['label'] == current_item), None)
-            movies_json_query.remove(
-                dict_to_remove) if dict_to_remove is not None and total_items > 1 else None
+            index_to_remove = next(
+                (index for index, item in enumerate(movies_json_query) if item['label'] == current_item), None)
+            if index_to_remove is not None and total_items > 1:
+                del movies_json_query[index_to_remove]
             add_items(self.li, movies_json_query, type='movie')
         # if there are tvshow results, remove the current item if it is in the list, then add the remaining to the plugin directory
         try:
@@ -311,10 +304,10 @@ class PluginContent(object):
         except Exception:
             log(f'Widget actor_credits: No tv shows found for {self.label}.')
         else:
-            dict_to_remove = next(
-                (item for item in tvshows_json_query if item['label'] == current_item), None)
-            tvshows_json_query.remove(
-                dict_to_remove) if dict_to_remove is not None and total_items > 1 else None
+            index_to_remove = next(
+                (index for index, item in enumerate(tvshows_json_query) if item['label'] == current_item), None)
+            if index_to_remove is not None and total_items > 1:
+                del tvshows_json_query[index_to_remove]
             add_items(self.li, tvshows_json_query, type='tvshow')
 
         set_plugincontent(content='videos',
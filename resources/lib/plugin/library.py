@@ -5,17 +5,28 @@ from xbmcgui import ListItem
 
 
 def add_items(li, json_query, type='helper'):
+    setters = {
+        'movie': set_movie,
+        'tvshow': set_tvshow,
+        'episode': set_episode,
+        'musicvideo': set_musicvideo
+    }
+    set_item = setters.get(type, set_helper)
     for item in json_query:
-        if type == 'movie':
-            set_movie(li, item)
-        elif type == 'tvshow':
-            set_tvshow(li, item)
-        elif type == 'episode':
-            set_episode(li, item)
-        elif type == 'musicvideo':
-            set_musicvideo(li, item)
-        else:
-            set_helper(li, item)
+        set_item(li, item)
+
+
+def set_streamdetails(videoInfoTag, streamdetails):
+    for key, value in streamdetails.items():
+        if 'video' in key:
+            for stream in value:
+                videostream = xbmc.VideoStreamDetail(**stream)
+                videoInfoTag.addVideoStream(videostream)
+        elif 'audio' in key:
+            for stream in value:
+                audiostreamlist = list(stream.values())
+                audiostream = xbmc.AudioStreamDetail(*audiostreamlist)
+                videoInfoTag.addAudioStream(audiostream)
 
 
 def set_helper(li, item):
@@ -42,15 +53,7 @@ def set_movie(li, item):
     videoInfoTag.setYear(item['year'])
     videoInfoTag.setStudios(item['studio'])
     videoInfoTag.setMpaa(item['mpaa'])
-    for key, value in iter(list(item['streamdetails'].items())):
-        for stream in value:
-            if 'video' in key:
-                videostream = xbmc.VideoStreamDetail(**stream)
-                videoInfoTag.addVideoStream(videostream)
-            elif 'audio' in key:
-                audiostreamlist = list(stream.values())
-                audiostream = xbmc.AudioStreamDetail(*audiostreamlist)
-                videoInfoTag.addAudioStream(audiostream)
+    set_streamdetails(videoInfoTag, item['streamdetails'])
 
     li_item.setArt(item['art'])
     li_item.setArt({'icon': 'DefaultMovies.png'})
@@ -113,15 +116,7 @@ def set_episode(li, item):
     videoInfoTag.setTvShowTitle(item['showtitle'])
     videoInfoTag.setStudios(item['studio'])
     videoInfoTag.setMpaa(item['mpaa'])
-    for key, value in iter(list(item['streamdetails'].items())):
-        for stream in value:
-            if 'video' in key:
-                videostream = xbmc.VideoStreamDetail(**stream)
-                videoInfoTag.addVideoStream(videostream)
-            elif 'audio' in key:
-                audiostreamlist = list(stream.values())
-                audiostream = xbmc.AudioStreamDetail(*audiostreamlist)
-                videoInfoTag.addAudioStream(audiostream)
+    set_streamdetails(videoInfoTag, item['streamdetails'])
 
     li_item.setArt(item['art'])
     li_item.setArt({'icon': 'DefaultTVShows.png'})
@@ -142,15 +137,7 @@ def set_musicvideo(li, item):
     videoInfoTag.setPlaycount(item['playcount'])
     videoInfoTag.setTitle(item['title'])
     videoInfoTag.setYear(item['year'])
-    for key, value in iter(list(item['streamdetails'].items())):
-        for stream in value:
-            if 'video' in key:
-                videostream = xbmc.VideoStreamDetail(**stream)
-                videoInfoTag.addVideoStream(videostream)
-            elif 'audio' in key:
-                audiostreamlist = list(stream.values())
-                audiostream = xbmc.AudioStreamDetail(*audiostreamlist)
-                videoInfoTag.addAudioStream(audiostream)
+    set_streamdetails(videoInfoTag, item['streamdetails'])
 
     li_item.setArt(item['art'])
     li_item.setArt({'icon': 'DefaultVideo.png'})
@@ -114,14 +114,9 @@ def play_items(id, **kwargs):
         except ValueError:
             break
         else:
-            if condition(f'String.IsEqual({method}({count}).DBType,movie)'):
-                media_type = 'movie'
-            elif condition(f'String.IsEqual({method}({count}).DBType,episode)'):
-                media_type = 'episode'
-            elif condition(f'String.IsEqual({method}({count}).DBType,song)'):
-                media_type = 'song'
-            elif condition(f'String.IsEqual({method}({count}).DBType,musicvideo)'):
-                media_type = 'musicvideo'
+            media_type = xbmc.getInfoLabel(f'{method}({count}).DBType')
+            if media_type not in ('movie', 'episode', 'song', 'musicvideo'):
+                media_type = False
 
             if media_type and dbid:
                 json_call('Playlist.Add',
@@ -179,7 +174,8 @@ def play_radio(**kwargs):
                                   )
 
         for count in json_response['result']['songs']:
-            if count.get('songid', None):
+            # The seed song is already queued, don't add it a second time
+            if count.get('songid', None) and count['songid'] != dbid:
                 songid = int(count['songid'])
 
                 json_call('Playlist.Add',
@@ -295,6 +291,9 @@ def widget_move(posa, posb, **kwargs):
         'View': '', 'Display': '', 'Content': '', 'Custom_Name': '', 'Custom_Target': '', 'Custom_SortMethod': '', 'Custom_SortOrder': '', 'Custom_Path': '', 'Custom_Limit': '', 'Autoscroll': False,
         'Trailer_Autoplay': False, 'Clearlogos_Enabled': False, 'Prefer_Keyart': False, 'Prefer_Landscape': False
     }
+    # split fields by type once rather than checking type per field per widget
+    string_keys = [key for key, value in template.items() if type(value) == str]
+    bool_keys = [key for key, value in template.items() if type(value) == bool]
     dica, dicb = {}, {}
     dica.update(template)
     dicb.update(template)
@@ -309,22 +308,22 @@ def widget_move(posa, posb, **kwargs):
                 xbmc.executebuiltin(
                     f'Skin.Reset(Widget{item[0]}_Content_{content})')
                 break
-        for key, value in item[1].items():
-            if type(value) == str and not value:
+        for key in string_keys:
+            if not item[1][key]:
                 item[1][key] = infolabel(f'Skin.String(Widget{item[0]}_{key})')
-            elif type(value) == bool and not value:
-                if condition(f'Skin.HasSetting(Widget{item[0]}_{key})'):
-                    # capture value of bool then reset it in Kodi
-                    item[1][key] = True
-                    xbmc.executebuiltin(
-                        f'Skin.Reset(Widget{item[0]}_{key})')
+        for key in bool_keys:
+            if condition(f'Skin.HasSetting(Widget{item[0]}_{key})'):
+                # capture value of bool then reset it in Kodi
+                item[1][key] = True
+                xbmc.executebuiltin(
+                    f'Skin.Reset(Widget{item[0]}_{key})')
     # swap values
     swapped_list = [(posa, dicb), (posb, dica)]
     for item in swapped_list:
         xbmc.executebuiltin(f'Skin.ToggleSetting(Widget{item[0]}_Content_{item[1]["Content"]})')
-        for key, value in item[1].items():
-            if type(value) == str:
-                skin_string(f'Widget{item[0]}_{key}', set=value)
-            elif type(value) == bool and value and 'Content' not in key:
+        for key in string_keys:
+            skin_string(f'Widget{item[0]}_{key}', set=item[1][key])
+        for key in bool_keys:
+            if item[1][key]:
                 xbmc.executebuiltin(
                     f'Skin.ToggleSetting(Widget{item[0]}_{key})')
@@ -2,6 +2,7 @@
 
 import hashlib
 import random
+from itertools import chain, repeat
 
 from PIL import Image, ImageFilter
 
@@ -44,34 +45,22 @@ class ImageEditor:
     def _handle_image(self, dbid=False, source='Container.ListItem', url=False, art_cat='clearlogos', art_type='clearlogo', process='crop'):
         # fetch art url
         art_cat = 'clearlogos' if 'clearlogo' in art_type else f'{art_type}s'
-        art = {art_type: url} if url else self._fetch_art_url(
-            art_type, source)
-        if art:
+        url = url or infolabel(f'{source}.Art({art_type})')
+        if url:
             # check for processed art in lookup table
-            attributes = self._read_lookup(art_cat, art)
+            attributes = self._read_lookup(art_cat, url)
             # or process and write to lookup if missing
             if not attributes:
                 process_method = getattr(self, f'_{process}_art', None)
-                attributes = process_method(dbid, art)
+                attributes = process_method(dbid, url)
                 self._write_lookup(art_type, attributes)
             return attributes
 
-    def _fetch_art_url(self, art_type, source):
-        art = {art_type: False}
-        url = infolabel(f'{source}.Art({art_type})')
-        if url:
-            art[art_type] = url
-            return art
-
-    def _read_lookup(self, art_cat, art):
-        root = self.xml.get_root()
-        art = list(art.items())[0]
-        if art[1]:
-            for node in root.find(art_cat):
-                processed = node.attrib.get('processed', None)
-                if art[1] in node.attrib['url'] and validate_path(processed):
-                    attributes = {key: value for key, value in node.attrib.items()}
-                    return attributes
+    def _read_lookup(self, art_cat, url):
+        node = self.xml.get_index(art_cat).get(url)
+        if node is not None and validate_path(node.attrib.get('processed', None)):
+            attributes = {key: value for key, value in node.attrib.items()}
+            return attributes
     
     def _write_lookup(self, art_type, attributes):
         if attributes:
@@ -80,9 +69,7 @@ class ImageEditor:
             art_type_root = root.find(f'{art_type}s')
             self.xml.add_sub_element(art_type_root, art_type, attributes)
 
-    def _blur_art(self, source, art):
-        art = list(art.items())[0]
-        url = art[1]
+    def _blur_art(self, source, url):
         source_url, destination_url = self._generate_image_urls(
             self.blur_folder, url, '.jpg')
         try:
@@ -106,9 +93,7 @@ class ImageEditor:
                 'processed': destination_url,
             }
 
-    def _crop_art(self, source, art):
-        art = list(art.items())[0]
-        url = art[1]
+    def _crop_art(self, source, url):
         source_url, destination_url = self._generate_image_urls(
             self.crop_folder, url, '.png')
         try:
@@ -207,8 +192,8 @@ class ImageEditor:
         pixeldata = small_image.getcolors(width * height)
         sorted_pixeldata = sorted(pixeldata, key=lambda t: t[0], reverse=True)
         opaque_pixeldata = [p for p in sorted_pixeldata if p[-1][-1] > 64]
-        opaque_pixels = [color for count,
-                         color in opaque_pixeldata for _ in range(count)]
+        opaque_pixels = list(chain.from_iterable(
+            repeat(color, count) for count, color in opaque_pixeldata))
         if not opaque_pixeldata:
             log('ImageEditor: Error - No opaque pixels found for calculation of dominant colour and luminosity', force=True)
             return ('ff000000', '0')
@@ -251,12 +236,10 @@ class SlideshowMonitor:
     def __init__(self, xml_handler=None):
         self.xml = xml_handler if xml_handler else XMLHandler()
         self.cropper = ImageEditor(self.xml).image_processor
-        # Establish available art types in the db:
-        self.art_types = [art_type for art_type in ['movies', 'tvshows',
-                                                    'video', 'music'] if condition(f'Library.HasContent({art_type})')]
-        # Replace 'music' with 'artists' and extend the list
-        self.art_types = ['artists' if art_type ==
-                          'music' else art_type for art_type in self.art_types]
+        # Establish available art types in the db, replacing 'music' with 'artists'
+        self.art_types = ['artists' if art_type == 'music' else art_type
+                          for art_type in ['movies', 'tvshows', 'video', 'music']
+                          if condition(f'Library.HasContent({art_type})')]
         self.art_types.extend(['custom', 'global'])
         # Initialize other variables
         self.fetch_count = self.MAX_FETCH_COUNT
@@ -312,8 +295,7 @@ class SlideshowMonitor:
                                       parent='get_item_details')
                     result = query['result'][f'{type}details']
                     if result['art'].get('fanart'):
-                        data = {'title': result.get('label', '')}
-                        data.update(result['art'])
+                        data = {'title': result.get('label', ''), **result['art']}
                         self.art['custom'].append(data)
             except KeyError:
                 pass
@@ -326,18 +308,17 @@ class SlideshowMonitor:
                 try:
                     for result in query['result'][item]:
                         if result['art'].get('fanart'):
-                            data = {'title': result.get('label', '')}
-                            data.update(result['art'])
+                            data = {'title': result.get('label', ''), **result['art']}
                             self.art[item].append(data)
                 except KeyError:
                     pass
         # Combine lists from self.art using generators to avoid key error for missing lists
         video_keys = ['movies', 'tvshows']
         global_keys = ['movies', 'tvshows', 'artists', 'custom']
-        self.art['video'] = sum((self.art.get(key, [])
-                                for key in video_keys), [])
-        self.art['global'] = sum((self.art.get(key, [])
-                                 for key in global_keys), [])
+        self.art['video'] = list(chain.from_iterable(
+            self.art.get(key, []) for key in video_keys))
+        self.art['global'] = list(chain.from_iterable(
+            self.art.get(key, []) for key in global_keys))
         # Trim both lists to self.MAX_FETCH_COUNT if they have more items
         for value in ['video', 'global']:
             if len(self.art[value]) > self.MAX_FETCH_COUNT:
@@ -347,10 +328,11 @@ class SlideshowMonitor:
 
     def _get_art_external(self):
         num_items = int(infolabel('Container(3300).NumItems'))
+        thumb_fallback = 'other' in self.custom_source
         for i in range(num_items):
             fanart = infolabel(
                 f'Container(3300).ListItem({i}).Art(fanart)')
-            if not fanart and 'other' in self.custom_source:
+            if not fanart and thumb_fallback:
                 fanart = infolabel(
                     f'Container(3300).ListItem({i}).Art(thumb)')
             if fanart:
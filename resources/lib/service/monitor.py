@@ -25,6 +25,12 @@ XMLSTR = '''<?xml version="1.0" encoding="utf-8"?>
 
 class Monitor(xbmc.Monitor):
     DEFAULT_REFRESH_INTERVAL = 10
+    IMAGES_TO_PROCESS = {
+        'clearlogo': 'crop',
+        'clearlogo-alt': 'crop',
+        'clearlogo-billboard': 'crop',
+        'fanart': 'blur'
+    }
 
     def __init__(self):
         # Poller
@@ -187,18 +193,12 @@ class Monitor(xbmc.Monitor):
             '!Container.Content() + '
             '!String.IsEmpty(ListItem.Art(fanart))'
         ):
-            images_to_process = {
-                'clearlogo': 'crop',
-                'clearlogo-alt': 'crop',
-                'clearlogo-billboard': 'crop',
-                'fanart': 'blur'
-            }
             # secondary list     
             if condition('Control.HasFocus(3100)'):
-                self._on_scroll(key='3100',processes=images_to_process)
+                self._on_scroll(key='3100', processes=self.IMAGES_TO_PROCESS)
             # primary list
             else:
-                self._on_scroll(processes=images_to_process)
+                self._on_scroll(processes=self.IMAGES_TO_PROCESS)
             self.waitForAbort(0.1)
 
         # home widgets has clearlogo visible
@@ -33,7 +33,7 @@ class SettingsMonitor:
             'pictures': False,
             'musicplayer': False
         }
-        for item in list(self.settings.items()):
+        for item in self.settings.items():
             window_property(key=item[0])
             category = item[0].split('.')[0]
             json_response = json_call('Settings.GetSettingValue',
@@ -46,15 +46,10 @@ class SettingsMonitor:
             except KeyError:
                 value = 'None'
             if value != item[1]:
-                if (
-                    (isinstance(value, int) and value == 0) or
-                    (isinstance(value, bool) and value == False)
-                ):
+                # bool is a subclass of int, so this covers False as well as 0
+                if isinstance(value, int) and not value:
                     value = '0'
-                elif (
-                    (isinstance(value, list) and value == []) or
-                    (isinstance(value, str) and value == '')
-                ):
+                elif isinstance(value, (list, str)) and not value:
                     value = 'None'
                 cats.update({category: True})
                 self.settings_to_change.update({item[0]: item[1]})
@@ -68,7 +63,7 @@ class SettingsMonitor:
 
     def set_default(self, **kwargs):
         count = 0
-        for item in list(self.settings_to_change.items()):
+        for item in self.settings_to_change.items():
             if condition(f'Skin.HasSetting({item[0]})'):
                 json_call('Settings.SetSettingValue',
                                         params={'setting': item[0], 'value': item[1]},
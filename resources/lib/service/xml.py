@@ -9,17 +9,16 @@ class XMLHandler:
     def __init__(self):
         self.lookup = LOOKUP_XML
         self._cached_lookup = None
+        self._cached_index = {}
         self._force_read = False
         self._force_write = False
-        self._instance_id = id(self)  # Unique identifier for each instance
 
     def get_root(self):
-        # Log instance ID to see if it is correctly being passed to other classes (ImageEditor, SlideshowMonitor, PlayerMonitor)
-        log(f'Using XMLHandler instance ID: {self._instance_id}')
         # Only reparse XML if it has not been cached or if forced to after a write.
         if self._cached_lookup is None or self._force_read:
             try:
                 self._cached_lookup = ET.parse(self.lookup)
+                self._cached_index = {}
                 log(f'Parsing _lookup.xml file')
             except (ET.ParseError, IOError) as e:
                 log(f'Error parsing _lookup.xml file --> {e}', force=True)
@@ -27,11 +26,20 @@ class XMLHandler:
                 self._force_read = False
         return self._cached_lookup
 
+    def get_index(self, art_cat):
+        # Map url --> node for an art category so lookups don't scan every node. Built on first use after each parse.
+        root = self.get_root()
+        if art_cat not in self._cached_index:
+            self._cached_index[art_cat] = {
+                node.attrib.get('url'): node for node in root.find(art_cat)}
+        return self._cached_index[art_cat]
+
     def add_sub_element(self, parent_element, tag_name, attributes):
         # Build a new sub element in the XML file ready for writing
         sub_element = ET.SubElement(parent_element, tag_name)
         for key, value in attributes.items():
             sub_element.attrib[key] = value
+        self._cached_index.pop(parent_element.tag, None)
         self._force_write = True
         return sub_element
 
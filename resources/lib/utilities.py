@@ -58,12 +58,9 @@ def get_folder_size(source=CROP_FOLDERPATH):
 
 
 def get_cache_size(precision=1):
-    temp_size, crop_size = 0, 0
-    if xbmcvfs.exists(TEMP_FOLDERPATH):
-        temp_size = get_folder_size(source=TEMP_FOLDERPATH)
-    if xbmcvfs.exists(CROP_FOLDERPATH):
-        crop_size = get_folder_size(source=CROP_FOLDERPATH)
-    size = temp_size + crop_size
+    # get_folder_size returns 0 for missing folders
+    size = get_folder_size(source=TEMP_FOLDERPATH) + \
+        get_folder_size(source=CROP_FOLDERPATH)
     ''' Credit Doug Latornell for bitshift method
     https://code.activestate.com/recipes/577081-humanized-representation-of-a-number-of-bytes/
     '''
@@ -119,11 +116,7 @@ def clear_cache(**kwargs):
 
 
 def get_joined_items(item):
-    if len(item) > 0 and item is not None:
-        item = ' / '.join(item)
-    else:
-        item = ''
-    return item
+    return ' / '.join(item) if item else ''
 
 
 def infolabel(infolabel):
@@ -184,9 +177,10 @@ def return_label(property=True, **kwargs):
     replace = kwargs.get('replace', ' ')
 
     count = label.count(find)
-    label = label.replace(urllib.unquote(find),
-                          urllib.unquote(replace),
-                          count)
+    if count:
+        label = label.replace(urllib.unquote(find),
+                              urllib.unquote(replace),
+                              count)
     if property:
         window_property('Return_Label', set=label)
     else: